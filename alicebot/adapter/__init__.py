@@ -79,7 +79,7 @@ class Adapter(Generic[T_Event, T_Config], ABC):
     async def startup(self):
         """在适配器开始运行前运行的方法，用于初始化适配器。
 
-        AliceBot 依次运行并等待所有适配器的 `startup()` 方法，待运行完毕后再创建 `run()` 任务。
+        AliceBot 并发运行并等待所有适配器的 `startup()` 方法，待运行完毕后再创建 `run()` 任务。
         """
         pass
 
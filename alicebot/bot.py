@@ -5,7 +5,8 @@ AliceBot 的基础模块，每一个 AliceBot 机器人即是一个 `Bot` 实例
 import os
 import sys
 import json
-import time
+import bisect
+import codecs
 import signal
 import asyncio
 import pkgutil
@@ -13,7 +14,20 @@ import threading
 from pathlib import Path
 from itertools import chain
 from collections import defaultdict
-from typing import Any, Dict, List, Type, Union, Callable, Optional, Awaitable
+from importlib.machinery import PathFinder
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Callable,
+    Optional,
+    Awaitable,
+    Coroutine,
+)
 
 from pydantic import ValidationError, create_model
 
@@ -32,8 +46,10 @@ from alicebot.exceptions import (
 from alicebot.utils import (
     ModulePathFinder,
     samefile,
+    _Condition,
     wrap_get_func,
     is_config_class,
+    _is_config_class,
     get_classes_from_module_name,
 )
 
@@ -42,6 +58,12 @@ try:
 except ModuleNotFoundError:
     import tomli as tomllib  # type: ignore
 
+try:
+    # 如果安装了 orjson 则使用 orjson 解析 JSON 配置文件
+    from orjson import loads as json_loads  # type: ignore
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
 
 __all__ = ["Bot"]
 
@@ -51,6 +73,14 @@ HANDLED_SIGNALS = (
 )
 
 
+def _plugin_file_key(path: str) -> str:
+    """返回插件文件路径在 `Bot._plugins_by_file` 中的键。
+
+    不解析符号链接，以便符号链接被删除后仍然能够找到从其加载的插件。
+    """
+    return os.path.normcase(os.path.abspath(path))
+
+
 class Bot:
     """AliceBot 机器人对象，定义了机器人的基本方法。
         读取并储存配置 `Config`，加载适配器 `Adapter` 和插件 `Plugin`，并进行事件分发。
@@ -59,8 +89,10 @@ class Bot:
         config: 机器人配置。
         should_exit: 机器人是否应该进入准备退出状态。
         adapters: 当前已经加载的适配器的列表。
-        plugins_priority_dict: 插件优先级字典。
-        plugin_state: 插件状态。
+        plugins_priority_dict: 插件优先级字典。应当视为只读，
+            请通过 `Bot` 的方法加载或重新加载插件，直接修改此字典不会更新插件的缓存信息，
+            可能导致插件不会被分发事件或无法被热重载移除。
+        plugin_state: 插件状态，以插件类名称为键。未设置状态的插件不会出现在此字典中。
         global_state: 全局状态。
     """
 
@@ -71,12 +103,18 @@ class Bot:
     plugin_state: Dict[str, Any]
     global_state: Dict[Any, Any]
 
-    _condition: asyncio.Condition  # 用于处理 get 的 Condition
-    _current_event: Event  # 当前待处理的 Event
+    _condition: _Condition[Event]  # 用于处理 get 的 Condition
+    _background_tasks: Set["asyncio.Task[Any]"]  # 保持对后台任务的引用，防止其被垃圾回收
 
+    _sorted_priorities: List[int]  # 已排序的插件优先级列表
+    _plugins_flat: List[Type[Plugin]]  # 缓存的插件列表
+    _plugins_flat_dirty: bool  # 插件列表缓存是否需要重建
+    _plugins_by_file: Dict[str, List[Tuple[int, Type[Plugin]]]]  # 插件文件路径映射
     _restart_flag: bool  # 重新启动标志
     _module_path_finder: ModulePathFinder  # 用于查找 plugins 的模块元路径查找器
     _raw_config_dict: Dict[str, Any]  # 原始配置字典
+    _config_model: Type[MainConfig]  # 合并了插件和适配器配置的配置模型
+    _config_model_key: Optional[Tuple[Any, ...]]  # 创建配置模型时使用的原始配置字典和配置类
 
     # 以下属性不会在重启时清除
     _config_file: Optional[str]  # 配置文件
@@ -88,13 +126,13 @@ class Bot:
     ]  # 使用 load_plugins() 方法程序化加载的插件列表
     _extend_plugin_dirs: List[Path]  # 使用 load_plugins_from_dirs() 方法程序化加载的插件路径列表
     _extend_adapters: List[Union[Type[Adapter], str]]  # 使用 load_adapter() 方法程序化加载的适配器列表
-    _bot_run_hooks: List[T_BotHook]
-    _bot_exit_hooks: List[T_BotHook]
-    _adapter_startup_hooks: List[T_AdapterHook]
-    _adapter_run_hooks: List[T_AdapterHook]
-    _adapter_shutdown_hooks: List[T_AdapterHook]
-    _event_preprocessor_hooks: List[T_EventHook]
-    _event_postprocessor_hooks: List[T_EventHook]
+    _bot_run_hooks: Tuple[T_BotHook, ...]
+    _bot_exit_hooks: Tuple[T_BotHook, ...]
+    _adapter_startup_hooks: Tuple[T_AdapterHook, ...]
+    _adapter_run_hooks: Tuple[T_AdapterHook, ...]
+    _adapter_shutdown_hooks: Tuple[T_AdapterHook, ...]
+    _event_preprocessor_hooks: Tuple[T_EventHook, ...]
+    _event_postprocessor_hooks: Tuple[T_EventHook, ...]
 
     def __init__(
         self,
@@ -115,13 +153,20 @@ class Bot:
         """
         self.config = MainConfig()
         self.plugins_priority_dict = defaultdict(list)
-        self.plugin_state = defaultdict(lambda: type(None)())
+        self._sorted_priorities = []
+        self._plugins_flat = []
+        self._plugins_flat_dirty = True
+        self._plugins_by_file = {}
+        self.plugin_state = {}
         self.global_state = {}
 
         self.adapters = []
         self._restart_flag = False
+        self._background_tasks = set()
         self._module_path_finder = ModulePathFinder()
         self._raw_config_dict = {}
+        self._config_model = MainConfig
+        self._config_model_key = None
 
         self._config_file = config_file
         self._config_dict = config_dict
@@ -130,20 +175,33 @@ class Bot:
         self._extend_plugins = []
         self._extend_plugin_dirs = []
         self._extend_adapters = []
-        self._bot_run_hooks = []
-        self._bot_exit_hooks = []
-        self._adapter_startup_hooks = []
-        self._adapter_run_hooks = []
-        self._adapter_shutdown_hooks = []
-        self._event_preprocessor_hooks = []
-        self._event_postprocessor_hooks = []
-
-        sys.meta_path.insert(0, self._module_path_finder)
+        self._bot_run_hooks = ()
+        self._bot_exit_hooks = ()
+        self._adapter_startup_hooks = ()
+        self._adapter_run_hooks = ()
+        self._adapter_shutdown_hooks = ()
+        self._event_preprocessor_hooks = ()
+        self._event_postprocessor_hooks = ()
+
+        # 插入到 PathFinder 之前，使内置模块和冻结模块的导入无需经过此查找器，
+        # 同时插件目录中的模块仍然优先于 sys.path 中的同名模块
+        for index, finder in enumerate(sys.meta_path):
+            if finder is PathFinder:
+                sys.meta_path.insert(index, self._module_path_finder)
+                break
+        else:
+            sys.meta_path.append(self._module_path_finder)
 
     @property
     def plugins(self) -> List[Type[Plugin]]:
-        """当前已经加载的插件的列表。"""
-        return list(chain(*self.plugins_priority_dict.values()))
+        """当前已经加载的插件的列表。
+
+        每次访问都会返回一个新的列表，修改此列表不会影响已经加载的插件。
+        """
+        if self._plugins_flat_dirty:
+            self._plugins_flat = list(chain(*self.plugins_priority_dict.values()))
+            self._plugins_flat_dirty = False
+        return self._plugins_flat.copy()
 
     def run(self):
         """运行 AliceBot ，监听并拦截系统退出信号，更新机器人配置。"""
@@ -165,7 +223,7 @@ class Bot:
     async def _run(self):
         """运行 AliceBot。"""
         self.should_exit = asyncio.Event()
-        self._condition = asyncio.Condition()
+        self._condition = _Condition()
 
         # 监听并拦截系统退出信号，从而完成一些善后工作后再关闭程序
         if threading.current_thread() is threading.main_thread():
@@ -199,22 +257,17 @@ class Bot:
             await _hook_func(self)
 
         try:
-            for _adapter in self.adapters:
-                for _hook_func in self._adapter_startup_hooks:
-                    await _hook_func(_adapter)
-                try:
-                    await _adapter.startup()
-                except Exception as e:
-                    error_or_exception(
-                        f"Startup adapter {_adapter!r} failed:",
-                        e,
-                        self.config.bot.log.verbose_exception,
-                    )
+            # 并发启动所有适配器，某个适配器启动失败不会影响其他适配器
+            for result in await asyncio.gather(
+                *map(self._startup_adapter, self.adapters), return_exceptions=True
+            ):
+                if isinstance(result, BaseException):
+                    raise result
 
             for _adapter in self.adapters:
                 for _hook_func in self._adapter_run_hooks:
                     await _hook_func(_adapter)
-                asyncio.create_task(_adapter.safe_run())
+                self._create_background_task(_adapter.safe_run())
 
             await self.should_exit.wait()
 
@@ -230,27 +283,58 @@ class Bot:
 
             self.adapters.clear()
             self.plugins_priority_dict.clear()
+            self._sorted_priorities = []
+            self._plugins_flat_dirty = True
+            self._plugins_by_file.clear()
             self._module_path_finder.path.clear()
+            _is_config_class.cache_clear()
+
+    def _create_background_task(
+        self, coro: Coroutine[Any, Any, Any]
+    ) -> "asyncio.Task[Any]":
+        """创建一个后台任务并保持对其的引用，直到任务完成。
+
+        事件循环仅保持对任务的弱引用，未被引用的任务可能在完成前被垃圾回收。
+        """
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def _startup_adapter(self, adapter: Adapter):
+        """运行适配器启动时的钩子函数并启动适配器。"""
+        for _hook_func in self._adapter_startup_hooks:
+            await _hook_func(adapter)
+        try:
+            await adapter.startup()
+        except Exception as e:
+            error_or_exception(
+                f"Startup adapter {adapter!r} failed:",
+                e,
+                self.config.bot.log.verbose_exception,
+            )
 
     def _remove_plugin_by_path(self, file: str) -> List[Type[Plugin]]:
         """根据路径删除已加载的插件。"""
         removed_plugins: List[Type[Plugin]] = []
-        for plugins in self.plugins_priority_dict.values():
-            _removed_plugins = list(
-                filter(
-                    lambda x: x.__plugin_load_type__ != PluginLoadType.CLASS
-                    and x.__plugin_file_path__ is not None
-                    and samefile(x.__plugin_file_path__, file),
-                    plugins,
-                )
+        for priority, plugin_ in self._plugins_by_file.pop(_plugin_file_key(file), []):
+            plugins = self.plugins_priority_dict.get(priority, [])
+            if plugin_ not in plugins:
+                continue
+            plugins.remove(plugin_)
+            removed_plugins.append(plugin_)
+            self._plugins_flat_dirty = True
+            logger.info(
+                f'Succeeded to remove plugin "{plugin_.__name__}" from file "{file}"'
             )
-            removed_plugins.extend(_removed_plugins)
-            for plugin_ in _removed_plugins:
-                plugins.remove(plugin_)
-                logger.info(
-                    "Succeeded to remove plugin "
-                    f'"{plugin_.__name__}" from file "{file}"'
-                )
+            if not plugins:
+                del self.plugins_priority_dict[priority]
+                self._sorted_priorities = [
+                    x for x in self._sorted_priorities if x != priority
+                ]
+        if removed_plugins:
+            # 被删除的插件不再被使用，清空缓存以免其无法被释放
+            _is_config_class.cache_clear()
         return removed_plugins
 
     async def _run_hot_reload(self):
@@ -278,9 +362,10 @@ class Bot:
             ),
             stop_event=self.should_exit,
         ):
-            # 按照 Change.deleted, Change.modified, Change.added 的顺序处理
-            # 以确保发生重命名时先处理删除再处理新增
-            for change_type, file in sorted(changes, key=lambda x: x[0], reverse=True):
+            # 同一次保存可能产生多个更改事件（例如先删除再重新创建文件），
+            # 先对本批次更改的文件去重，再根据文件的最终状态决定如何处理
+            changed_files: Set[str] = set()
+            for change_type, file in changes:
                 # 更改配置文件
                 if (
                     self._config_file is not None
@@ -312,49 +397,94 @@ class Bot:
                     if not (os.path.isfile(file) and file.endswith(".py")):
                         continue
 
-                if change_type == Change.added:
-                    logger.info(f"Hot reload: added file: {file}")
-                    self._load_plugins(Path(file), plugin_load_type=PluginLoadType.DIR)
-                    self._update_config()
-                    continue
-                elif change_type == Change.deleted:
-                    logger.info(f"Hot reload: Deleted file: {file}")
-                    self._remove_plugin_by_path(file)
-                    self._update_config()
-                elif change_type == Change.modified:
-                    logger.info(f"Hot reload: Modified file: {file}")
-                    self._remove_plugin_by_path(file)
-                    self._load_plugins(Path(file), plugin_load_type=PluginLoadType.DIR)
-                    self._update_config()
+                changed_files.add(file)
+
+            to_add: Set[str] = set()
+            to_modify: Set[str] = set()
+            to_delete: Set[str] = set()
+            for file in changed_files:
+                if not os.path.isfile(file):
+                    to_delete.add(file)
+                elif _plugin_file_key(file) in self._plugins_by_file:
+                    to_modify.add(file)
+                else:
+                    to_add.add(file)
+
+            # 按照删除、修改、新增的顺序处理
+            # 以确保发生重命名时先处理删除再处理新增
+            for file in sorted(to_delete):
+                logger.info(f"Hot reload: Deleted file: {file}")
+                self._remove_plugin_by_path(file)
+            for file in sorted(to_modify):
+                logger.info(f"Hot reload: Modified file: {file}")
+                self._remove_plugin_by_path(file)
+                self._load_plugins(Path(file), plugin_load_type=PluginLoadType.DIR)
+            for file in sorted(to_add):
+                logger.info(f"Hot reload: added file: {file}")
+                self._load_plugins(Path(file), plugin_load_type=PluginLoadType.DIR)
+
+            # 处理完本批次的所有更改后再统一更新配置
+            if to_add or to_modify or to_delete:
+                self._update_config()
 
     def _update_config(self):
         """更新 config ，合并入来自 Plugin 和 Adapter 的 Config。"""
 
+        def get_config_classes(source: List) -> Tuple[Type[ConfigModel], ...]:
+            return tuple(
+                config_class
+                for config_class in map(lambda x: getattr(x, "Config", None), source)
+                if is_config_class(config_class)
+            )
+
         def update_config(
-            source: List, name: str, base: Type[ConfigModel]
+            config_classes: Tuple[Type[ConfigModel], ...],
+            name: str,
+            base: Type[ConfigModel],
         ) -> ConfigModel:
             config_update_dict = {}
-            for i in source:
-                config_class = getattr(i, "Config", None)
-                if is_config_class(config_class):
-                    try:
-                        default_value = config_class()
-                    except ValidationError:
-                        default_value = ...
-                    config_update_dict[getattr(config_class, "__config_name__")] = (
-                        config_class,
-                        default_value,
-                    )
+            for config_class in config_classes:
+                try:
+                    default_value = config_class()
+                except ValidationError:
+                    default_value = ...
+                config_update_dict[getattr(config_class, "__config_name__")] = (
+                    config_class,
+                    default_value,
+                )
             return create_model(name, **config_update_dict, __base__=base)(
                 **self._raw_config_dict
             )
 
-        self.config = create_model(
-            "Config",
-            plugin=update_config(self.plugins, "PluginConfig", PluginConfig),
-            adapter=update_config(self.adapters, "AdapterConfig", AdapterConfig),
-            __base__=MainConfig,
-        )(**self._raw_config_dict)
+        plugin_config_classes = get_config_classes(self.plugins)
+        adapter_config_classes = get_config_classes(self.adapters)
+        if not plugin_config_classes and not adapter_config_classes:
+            # 没有需要合并的配置类时直接使用 MainConfig，无需创建配置模型
+            self._config_model = MainConfig
+            self._config_model_key = None
+        # 仅当原始配置字典或插件和适配器的配置类发生变化时才重新创建配置模型
+        elif (
+            self._config_model_key is None
+            or self._config_model_key[0] is not self._raw_config_dict
+            or self._config_model_key[1:]
+            != (plugin_config_classes, adapter_config_classes)
+        ):
+            self._config_model = create_model(
+                "Config",
+                plugin=update_config(
+                    plugin_config_classes, "PluginConfig", PluginConfig
+                ),
+                adapter=update_config(
+                    adapter_config_classes, "AdapterConfig", AdapterConfig
+                ),
+                __base__=MainConfig,
+            )
+            self._config_model_key = (
+                self._raw_config_dict,
+                plugin_config_classes,
+                adapter_config_classes,
+            )
+        self.config = self._config_model(**self._raw_config_dict)
         # 更新 log 级别
         logger.remove()
         logger.add(sys.stderr, level=self.config.bot.log.level)
@@ -368,7 +498,11 @@ class Bot:
             try:
                 with open(self._config_file, "rb") as f:
                     if self._config_file.endswith(".json"):
-                        self._raw_config_dict = json.load(f)
+                        data = f.read()
+                        # orjson 不支持 BOM，例如记事本保存的 UTF-8 文件
+                        if data.startswith(codecs.BOM_UTF8):
+                            data = data[len(codecs.BOM_UTF8) :]
+                        self._raw_config_dict = json_loads(data)
                     elif self._config_file.endswith(".toml"):
                         self._raw_config_dict = tomllib.load(f)
                     else:
@@ -396,6 +530,10 @@ class Bot:
     def reload_plugins(self):
         """手动重新加载所有插件。"""
         self.plugins_priority_dict.clear()
+        self._sorted_priorities = []
+        self._plugins_flat_dirty = True
+        self._plugins_by_file.clear()
+        _is_config_class.cache_clear()
         self._load_plugins(*self.config.bot.plugins)
         self._load_plugins_from_dirs(*self.config.bot.plugin_dirs)
         self._load_plugins(*self._extend_plugins)
@@ -428,41 +566,46 @@ class Bot:
             show_log: 是否在日志中显示，默认为 `True`。
         """
         if show_log:
+            # 由 loguru 延迟格式化日志消息，日志级别未启用时不会调用 repr()
             logger.info(
-                f"Adapter {current_event.adapter.name} received: {current_event!r}"
+                "Adapter {} received: {!r}", current_event.adapter.name, current_event
             )
 
         if handle_get:
-            asyncio.create_task(self._handle_event())
+            self._create_background_task(self._handle_event())
             await asyncio.sleep(0)
+            # 获取锁后再发布事件，以确保上面创建的 _handle_event 任务已经在等待，
+            # 否则当锁正被 get() 的等待者持有时，此任务尚未开始等待，事件将会丢失
             async with self._condition:
-                self._current_event = current_event
-                self._condition.notify_all()
+                self._condition.publish(current_event)
         else:
-            asyncio.create_task(self._handle_event(current_event))
+            self._create_background_task(self._handle_event(current_event))
 
     async def _handle_event(self, current_event: Optional[Event] = None):
         if current_event is None:
             async with self._condition:
-                await self._condition.wait()
-                current_event = self._current_event
+                current_event = await self._condition.wait()
             if current_event.__handled__:
                 return
 
-        for _hook_func in self._event_preprocessor_hooks:
-            await _hook_func(current_event)
+        preprocessor_hooks = self._event_preprocessor_hooks
+        if preprocessor_hooks:
+            for _hook_func in preprocessor_hooks:
+                await _hook_func(current_event)
 
-        for plugin_priority in sorted(self.plugins_priority_dict.keys()):
+        # 事件分发的热路径，将频繁访问的属性绑定到局部变量
+        plugins_priority_dict = self.plugins_priority_dict
+        for plugin_priority in self._sorted_priorities:
             try:
                 logger.debug(
-                    f"Checking for matching plugins with priority {plugin_priority!r}"
+                    "Checking for matching plugins with priority {!r}", plugin_priority
                 )
                 stop = False
-                for _plugin in self.plugins_priority_dict[plugin_priority]:
+                for _plugin in plugins_priority_dict.get(plugin_priority, ()):
                     try:
                         _plugin = _plugin(current_event)
                         if await _plugin.rule():
-                            logger.info(f"Event will be handled by {_plugin!r}")
+                            logger.info("Event will be handled by {!r}", _plugin)
                             try:
                                 await _plugin.handle()
                             finally:
@@ -489,8 +632,10 @@ class Bot:
                     self.config.bot.log.verbose_exception,
                 )
 
-        for _hook_func in self._event_postprocessor_hooks:
-            await _hook_func(current_event)
+        postprocessor_hooks = self._event_postprocessor_hooks
+        if postprocessor_hooks:
+            for _hook_func in postprocessor_hooks:
+                await _hook_func(current_event)
 
         logger.info("Event Finished")
 
@@ -519,29 +664,30 @@ class Bot:
         _func = wrap_get_func(func)
 
         try_times = 0
-        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
         while not self.should_exit.is_set():
             if max_try_times is not None and try_times > max_try_times:
                 break
-            if timeout is not None and time.time() - start_time > timeout:
+            if deadline is not None and loop.time() >= deadline:
                 break
 
             async with self._condition:
-                if timeout is None:
-                    await self._condition.wait()
+                if deadline is None:
+                    current_event = await self._condition.wait()
                 else:
                     try:
-                        await asyncio.wait_for(
+                        current_event = await asyncio.wait_for(
                             self._condition.wait(),
-                            timeout=start_time + timeout - time.time(),
+                            timeout=deadline - loop.time(),
                         )
                     except asyncio.TimeoutError:
                         break
 
-                if not self._current_event.__handled__:
-                    if await _func(self._current_event):
-                        self._current_event.__handled__ = True
-                        return self._current_event
+                if not current_event.__handled__:
+                    if await _func(current_event):
+                        current_event.__handled__ = True
+                        return current_event
 
                 try_times += 1
 
@@ -563,7 +709,20 @@ class Bot:
                     )
             plugin_class.__plugin_load_type__ = plugin_load_type
             plugin_class.__plugin_file_path__ = plugin_file_path
+            if priority not in self.plugins_priority_dict:
+                # 创建副本而非原地修改，避免影响正在进行中的事件分发
+                sorted_priorities = self._sorted_priorities.copy()
+                bisect.insort(sorted_priorities, priority)
+                self._sorted_priorities = sorted_priorities
             self.plugins_priority_dict[priority].append(plugin_class)
+            self._plugins_flat_dirty = True
+            if (
+                plugin_load_type != PluginLoadType.CLASS
+                and plugin_file_path is not None
+            ):
+                self._plugins_by_file.setdefault(
+                    _plugin_file_key(plugin_file_path), []
+                ).append((priority, plugin_class))
             logger.info(
                 f'Succeeded to load plugin "{plugin_class.__name__}" '
                 f'from class "{plugin_class!r}"'
@@ -812,7 +971,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._bot_run_hooks.append(func)
+        self._bot_run_hooks = self._bot_run_hooks + (func,)
         return func
 
     def bot_exit_hook(self, func: T_BotHook) -> T_BotHook:
@@ -824,7 +983,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._bot_exit_hooks.append(func)
+        self._bot_exit_hooks = self._bot_exit_hooks + (func,)
         return func
 
     def adapter_startup_hook(self, func: T_AdapterHook) -> T_AdapterHook:
@@ -836,7 +995,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._adapter_startup_hooks.append(func)
+        self._adapter_startup_hooks = self._adapter_startup_hooks + (func,)
         return func
 
     def adapter_run_hook(self, func: T_AdapterHook) -> T_AdapterHook:
@@ -848,7 +1007,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._adapter_run_hooks.append(func)
+        self._adapter_run_hooks = self._adapter_run_hooks + (func,)
         return func
 
     def adapter_shutdown_hook(self, func: T_AdapterHook) -> T_AdapterHook:
@@ -860,7 +1019,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._adapter_shutdown_hooks.append(func)
+        self._adapter_shutdown_hooks = self._adapter_shutdown_hooks + (func,)
         return func
 
     def event_preprocessor_hook(self, func: T_EventHook) -> T_EventHook:
@@ -872,7 +1031,7 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._event_preprocessor_hooks.append(func)
+        self._event_preprocessor_hooks = self._event_preprocessor_hooks + (func,)
         return func
 
     def event_postprocessor_hook(self, func: T_EventHook) -> T_EventHook:
@@ -884,5 +1043,5 @@ class Bot:
         Returns:
             被注册的函数。
         """
-        self._event_postprocessor_hooks.append(func)
+        self._event_postprocessor_hooks = self._event_postprocessor_hooks + (func,)
         return func
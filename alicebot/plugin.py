@@ -95,8 +95,8 @@ class Plugin(ABC, Generic[T_Event, T_State, T_Config]):
     @final
     @property
     def state(self) -> T_State:
-        """插件状态。"""
-        return self.bot.plugin_state[self.name]
+        """插件状态，未设置时为 `None`。"""
+        return self.bot.plugin_state.get(self.name)  # type: ignore
 
     @final
     @state.setter
@@ -8,17 +8,21 @@ import traceback
 import dataclasses
 from abc import ABC
 from types import ModuleType
-from functools import partial
+from collections import deque
+from functools import partial, lru_cache
 from importlib.abc import MetaPathFinder
-from importlib.machinery import PathFinder
 from typing_extensions import ParamSpec, TypeGuard
+from importlib.machinery import ModuleSpec, PathFinder
 from typing import (
     TYPE_CHECKING,
     Any,
+    Dict,
     List,
     Type,
+    Deque,
     Tuple,
     Union,
+    Generic,
     TypeVar,
     Callable,
     Optional,
@@ -48,10 +52,78 @@ _P = ParamSpec("_P")
 _R = TypeVar("_R")
 
 
+class _Condition(Generic[_T]):
+    """类似于 `asyncio.Condition` 的条件变量，等待者被唤醒时将获得发布的值。
+
+    每个等待者通过各自的 Future 获得发布的值，因此不会因为值被之后的发布覆盖而读到错误的值。
+    `publish()` 只会唤醒已经在等待的任务，因此应在持有锁时调用，
+    以确保正在排队获取锁的任务不会错过发布的值。
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._waiters: Deque["asyncio.Future[_T]"] = deque()
+
+    async def __aenter__(self):
+        await self._lock.acquire()
+
+    async def __aexit__(self, *args: Any):
+        self._lock.release()
+
+    async def wait(self) -> _T:
+        """释放锁并等待直到有新的值被发布，返回前将重新获取锁。
+
+        Returns:
+            被发布的值。
+
+        Raises:
+            RuntimeError: 调用此方法时未持有锁。
+        """
+        if not self._lock.locked():
+            raise RuntimeError("cannot wait on un-acquired lock")
+
+        self._lock.release()
+        try:
+            fut: "asyncio.Future[_T]" = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                return await fut
+            finally:
+                self._waiters.remove(fut)
+        finally:
+            # 无论是否被取消，都必须重新获取锁
+            cancelled = False
+            while True:
+                try:
+                    await self._lock.acquire()
+                    break
+                except asyncio.CancelledError:
+                    cancelled = True
+            if cancelled:
+                raise asyncio.CancelledError
+
+    def publish(self, value: _T):
+        """发布一个新的值并唤醒所有已经在等待的任务，应在持有锁时调用。
+
+        Args:
+            value: 被发布的值。
+        """
+        for fut in self._waiters:
+            if not fut.done():
+                fut.set_result(value)
+
+
 class ModulePathFinder(MetaPathFinder):
-    """用于查找 AliceBot 组件的元路径查找器。"""
+    """用于查找 AliceBot 组件的元路径查找器。
+
+    查找结果（包括未找到的结果）会被缓存，调用 `importlib.invalidate_caches()` 时清空缓存。
+    """
 
     path: List[str] = []
+    _spec_cache: Dict[Tuple[str, Tuple[str, ...]], Optional[ModuleSpec]]
+
+    def __init__(self):
+        self._spec_cache = {}
 
     def find_spec(
         self,
@@ -59,9 +131,20 @@ class ModulePathFinder(MetaPathFinder):
         path: Optional[Sequence[str]] = None,
         target: Optional[ModuleType] = None,
     ):
-        if path is None:
-            path = []
-        return PathFinder.find_spec(fullname, self.path + list(path), target)
+        search_path = tuple(self.path) + tuple(path or ())
+        if target is not None:
+            # 重新加载模块时不使用缓存
+            return PathFinder.find_spec(fullname, list(search_path), target)
+        key = (fullname, search_path)
+        try:
+            return self._spec_cache[key]
+        except KeyError:
+            spec = PathFinder.find_spec(fullname, list(search_path))
+            self._spec_cache[key] = spec
+            return spec
+
+    def invalidate_caches(self):
+        self._spec_cache.clear()
 
 
 def is_config_class(config_class: Any) -> TypeGuard[Type[ConfigModel]]:
@@ -73,9 +156,14 @@ def is_config_class(config_class: Any) -> TypeGuard[Type[ConfigModel]]:
     Returns:
         返回是否是配置类。
     """
+    return inspect.isclass(config_class) and _is_config_class(config_class)
+
+
+@lru_cache(maxsize=None)
+def _is_config_class(config_class: type) -> bool:
+    """`is_config_class()` 的实现，结果按类缓存，插件被删除或重新加载时由 `Bot` 清空缓存。"""
     return (
-        inspect.isclass(config_class)
-        and issubclass(config_class, ConfigModel)
+        issubclass(config_class, ConfigModel)
         and isinstance(getattr(config_class, "__config_name__", None), str)
         and ABC not in config_class.__bases__
         and not inspect.isabstract(config_class)
@@ -202,8 +290,12 @@ def wrap_get_func(
         异步函数。
     """
     if func is None:
-        return sync_func_wrapper(lambda _: True)
+        return _always_true
     elif not asyncio.iscoroutinefunction(func):
         return sync_func_wrapper(func)  # type: ignore
     else:
         return func
+
+
+async def _always_true(_: "Event") -> bool:
+    return True
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from alicebot.utils import _Condition as Condition
+
+
+class TestCondition:
+    # 等价类: publish 唤醒所有等待者，并传递发布的值
+    def test_publish_wakes_all_waiters(self):
+        async def main():
+            condition = Condition()
+            results = []
+
+            async def waiter():
+                async with condition:
+                    results.append(await condition.wait())
+
+            tasks = [asyncio.create_task(waiter()) for _ in range(3)]
+            await asyncio.sleep(0)
+            async with condition:
+                condition.publish("value")
+            await asyncio.gather(*tasks)
+            return results
+
+        assert asyncio.run(main()) == ["value", "value", "value"]
+
+    # 边界条件: 没有等待者时 publish
+    def test_publish_without_waiter(self):
+        async def main():
+            condition = Condition()
+            async with condition:
+                condition.publish("no waiter")
+
+        asyncio.run(main())
+
+    # 边界条件: 未持有锁时调用 wait
+    def test_wait_without_lock(self):
+        async def main():
+            await Condition().wait()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(main())
+
+    # 边界条件: 等待超时后仍重新获取锁
+    def test_wait_timeout_reacquires_lock(self):
+        async def main():
+            condition = Condition()
+            async with condition:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(condition.wait(), timeout=0.01)
+                assert condition._lock.locked()
+            assert not condition._lock.locked()
+
+        asyncio.run(main())
@@ -0,0 +1,54 @@
+import asyncio
+from typing import List
+
+from alicebot import Bot, Plugin
+from alicebot.event import Event
+from alicebot.adapter import Adapter
+from alicebot.exceptions import GetEventTimeout
+
+
+class HandleEventTestEvent(Event["HandleEventTestAdapter"]):
+    message: str
+
+
+class HandleEventTestAdapter(Adapter[HandleEventTestEvent, None]):
+    name: str = "handle_event_test"
+
+    async def run(self):
+        await asyncio.sleep(0.05)
+        for message in ("e1", "e2", "e3", "e4"):
+            await self.handle_event(
+                HandleEventTestEvent(adapter=self, type="message", message=message),
+                show_log=False,
+            )
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)
+        self.bot.should_exit.set()
+
+
+class TestHandleEvent:
+    # 边界条件: get() 的等待者在持有锁时等待异步的判断函数，事件仍然不会丢失
+    def test_events_not_lost_when_lock_is_held(self):
+        received: List[str] = []
+
+        async def slow_predicate(_event: Event) -> bool:
+            await asyncio.sleep(0.05)
+            return False
+
+        class GetPlugin(Plugin):
+            async def rule(self) -> bool:
+                received.append(self.event.message)
+                return self.event.message == "e1"
+
+            async def handle(self) -> None:
+                try:
+                    await self.get(slow_predicate, max_try_times=1)
+                except GetEventTimeout:
+                    pass
+
+        bot = Bot(config_file=None)
+        bot.load_plugins(GetPlugin)
+        bot.load_adapters(HandleEventTestAdapter)
+        bot.run()
+
+        assert received == ["e1", "e2", "e3", "e4"]
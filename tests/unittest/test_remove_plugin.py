@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from alicebot import Bot
+from alicebot.utils import _is_config_class
+
+PLUGIN_SOURCE = """from alicebot import Plugin
+
+
+class SymlinkTestPlugin(Plugin):
+    async def handle(self) -> None:
+        pass
+
+    async def rule(self) -> bool:
+        return False
+"""
+
+
+class TestRemovePlugin:
+    # 边界条件: 插件文件是符号链接，且符号链接已被删除
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires os.symlink")
+    def test_remove_deleted_symlink_plugin(self, tmp_path: Path):
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "symlink_test_plugin.py").write_text(PLUGIN_SOURCE)
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        link = plugin_dir / "symlink_test_plugin.py"
+        os.symlink(source_dir / "symlink_test_plugin.py", link)
+
+        bot = Bot(config_file=None)
+        bot.load_plugins_from_dirs(plugin_dir)
+        assert [x.__name__ for x in bot.plugins] == ["SymlinkTestPlugin"]
+
+        file = os.path.join(str(plugin_dir.resolve()), "symlink_test_plugin.py")
+        os.remove(link)
+        removed = bot._remove_plugin_by_path(file)
+
+        assert [x.__name__ for x in removed] == ["SymlinkTestPlugin"]
+        assert bot.plugins == []
+        assert bot.plugins_priority_dict == {}
+
+    # 等价类: 删除插件后清空配置类缓存
+    def test_remove_plugin_clears_config_class_cache(self, tmp_path: Path):
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        (plugin_dir / "symlink_test_plugin.py").write_text(PLUGIN_SOURCE)
+
+        bot = Bot(config_file=None)
+        bot.load_plugins_from_dirs(plugin_dir)
+        _is_config_class(bot.plugins[0])
+        assert _is_config_class.cache_info().currsize > 0
+
+        bot._remove_plugin_by_path(str(plugin_dir / "symlink_test_plugin.py"))
+
+        assert _is_config_class.cache_info().currsize == 0